@@ -21,6 +21,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 """Base classes and enums inherited and used throughout the interactions flow."""
+
 from __future__ import annotations
 
 __all__: typing.List[str] = [
@@ -168,26 +169,26 @@ The following are valid for this:
 
 
 @attr_extensions.with_copy
-@attr.define(hash=True, kw_only=True, weakref_slot=False)
+@attr.define(eq=False, hash=False, kw_only=True, weakref_slot=False)
 class PartialInteraction(snowflakes.Unique, webhooks.ExecutableWebhook):
     """The base model for all interaction models."""
 
-    app: traits.RESTAware = attr.field(repr=False, eq=False, metadata={attr_extensions.SKIP_DEEP_COPY: True})
+    app: traits.RESTAware = attr.field(repr=False, metadata={attr_extensions.SKIP_DEEP_COPY: True})
     """The client application that models may use for procedures."""
 
-    id: snowflakes.Snowflake = attr.field(hash=True, repr=True)
+    id: snowflakes.Snowflake = attr.field(repr=True)
     # <<inherited docstring from Unique>>.
 
-    application_id: snowflakes.Snowflake = attr.field(eq=False, repr=False)
+    application_id: snowflakes.Snowflake = attr.field(repr=False)
     """ID of the application this interaction belongs to."""
 
-    type: typing.Union[InteractionType, int] = attr.field(eq=False, repr=True)
+    type: typing.Union[InteractionType, int] = attr.field(repr=True)
     """The type of interaction this is."""
 
-    token: str = attr.field(eq=False, repr=False)
+    token: str = attr.field(repr=False)
     """The interaction's token."""
 
-    version: int = attr.field(eq=False, repr=True)
+    version: int = attr.field(repr=True)
     """Version of the interaction system this interaction is under."""
 
     @property
@@ -21,6 +21,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 """Models and enums used for Discord's Slash Commands interaction flow."""
+
 from __future__ import annotations
 
 __all__: typing.List[str] = [
@@ -36,6 +37,7 @@ __all__: typing.List[str] = [
     "OptionType",
 ]
 
+import sys
 import typing
 
 import attr
@@ -80,6 +82,11 @@ The following types are valid for this:
 * `hikari.interactions.bases.ResponseType.DEFERRED_MESSAGE_CREATE`/`5`
 """
 
+# Pre-bound here so the response builder factories don't pay two enum
+# attribute loads per call.
+_MESSAGE_CREATE: typing.Final[bases.ResponseType] = bases.ResponseType.MESSAGE_CREATE
+_DEFERRED_MESSAGE_CREATE: typing.Final[bases.ResponseType] = bases.ResponseType.DEFERRED_MESSAGE_CREATE
+
 
 @typing.final
 class OptionType(int, enums.Enum):
@@ -122,19 +129,17 @@ class OptionType(int, enums.Enum):
     """
 
 
-@attr_extensions.with_copy
 @attr.define(hash=False, kw_only=True, weakref_slot=False)
 class CommandChoice:
     """Represents the choices set for an application command's argument."""
 
-    name: str = attr.field(repr=True)
+    name: str = attr.field(converter=sys.intern, repr=True)
     """The choice's name (inclusively between 1-100 characters)."""
 
     value: typing.Union[str, int, float] = attr.field(repr=True)
     """Value of the choice (up to 100 characters if a string)."""
 
 
-@attr_extensions.with_copy
 @attr.define(hash=False, kw_only=True, weakref_slot=False)
 class CommandOption:
     """Represents an application command's argument."""
@@ -142,7 +147,7 @@ class CommandOption:
     type: typing.Union[OptionType, int] = attr.field(repr=True)
     """The type of command option this is."""
 
-    name: str = attr.field(repr=True)
+    name: str = attr.field(converter=sys.intern, repr=True)
     r"""The command option's name.
 
     !!! note
@@ -170,44 +175,79 @@ class CommandOption:
     options: typing.Optional[typing.Sequence[CommandOption]] = attr.field(default=None, repr=False)
     """Sequence of up to (and including) 25 of the options for this command option."""
 
+    def walk_options(self) -> typing.Iterator[CommandOption]:
+        """Iterate over this option and all the options nested under it.
+
+        The walk is depth-first and is driven by an explicit stack rather
+        than recursive calls to keep deeply nested subcommand trees cheap.
+
+        Returns
+        -------
+        typing.Iterator[CommandOption]
+            Iterator of this option followed by its descendants.
+        """
+        stack = [self]
+        while stack:
+            option = stack.pop()
+            yield option
+            if option.options:
+                stack.extend(reversed(option.options))
+
 
 @attr_extensions.with_copy
-@attr.define(hash=True, kw_only=True, weakref_slot=False)
+@attr.define(eq=False, hash=False, kw_only=True, weakref_slot=False)
 class Command(snowflakes.Unique):
     """Represents an application command on Discord."""
 
-    app: traits.RESTAware = attr.field(eq=False, hash=False, repr=False)
+    app: traits.RESTAware = attr.field(repr=False)
     """The client application that models may use for procedures."""
 
-    id: snowflakes.Snowflake = attr.field(hash=True, repr=True)
+    id: snowflakes.Snowflake = attr.field(repr=True)
     # <<inherited docstring from Unique>>.
 
-    application_id: snowflakes.Snowflake = attr.field(eq=False, hash=False, repr=True)
+    application_id: snowflakes.Snowflake = attr.field(repr=True)
     """ID of the application this command belongs to."""
 
-    name: str = attr.field(eq=False, hash=False, repr=True)
+    name: str = attr.field(converter=sys.intern, repr=True)
     r"""The command's name.
 
     !!! note
         This will match the regex `^[a-z0-9_-]{1,32}$`.
     """
 
-    description: str = attr.field(eq=False, hash=False, repr=False)
+    description: str = attr.field(repr=False)
     """The command's description.
 
     !!! note
         This will be inclusively between 1-100 characters in length.
     """
 
-    options: typing.Optional[typing.Sequence[CommandOption]] = attr.field(eq=False, hash=False, repr=False)
+    options: typing.Optional[typing.Sequence[CommandOption]] = attr.field(repr=False)
     """Sequence of up to (and including) 25 of the options for this command."""
 
-    guild_id: typing.Optional[snowflakes.Snowflake] = attr.field(eq=False, hash=False, repr=False)
+    guild_id: typing.Optional[snowflakes.Snowflake] = attr.field(repr=False)
     """ID of the guild this command is in.
 
     This will be `builtins.None` if this is a global command.
     """
 
+    def __repr__(self) -> str:
+        # Hand-written instead of attrs-generated to skip the reflective
+        # field walk; keep in sync with the repr=True fields above.
+        return f"Command(id={self.id!r}, application_id={self.application_id!r}, name={self.name!r})"
+
+    def __getstate__(self) -> typing.Tuple[typing.Any, ...]:
+        # A plain value tuple pickles faster than the reflective slot-dict
+        # state attrs would otherwise build; keep in sync with the fields.
+        return (self.app, self.id, self.application_id, self.name, self.description, self.options, self.guild_id)
+
+    def __setstate__(self, state: typing.Tuple[typing.Any, ...]) -> None:
+        self.app, self.id, self.application_id, self.name, self.description, self.options, self.guild_id = state
+
+    @property
+    def _guild_or_undefined(self) -> undefined.UndefinedOr[snowflakes.Snowflake]:
+        return undefined.UNDEFINED if self.guild_id is None else self.guild_id
+
     async def fetch_self(self) -> Command:
         """Fetch an up-to-date version of this command object.
 
@@ -238,9 +278,7 @@ class Command(snowflakes.Unique):
         hikari.errors.InternalServerError
             If an internal error occurs on Discord while handling the request.
         """
-        return await self.app.rest.fetch_application_command(
-            self.application_id, self.id, undefined.UNDEFINED if self.guild_id is None else self.guild_id
-        )
+        return await self.app.rest.fetch_application_command(self.application_id, self.id, self._guild_or_undefined)
 
     async def edit(
         self,
@@ -299,7 +337,7 @@ class Command(snowflakes.Unique):
         return await self.app.rest.edit_application_command(
             self.application_id,
             self.id,
-            undefined.UNDEFINED if self.guild_id is None else self.guild_id,
+            self._guild_or_undefined,
             name=name,
             description=description,
             options=options,
@@ -330,9 +368,7 @@ class Command(snowflakes.Unique):
         hikari.errors.InternalServerError
             If an internal error occurs on Discord while handling the request.
         """
-        await self.app.rest.delete_application_command(
-            self.application_id, self.id, undefined.UNDEFINED if self.guild_id is None else self.guild_id
-        )
+        await self.app.rest.delete_application_command(self.application_id, self.id, self._guild_or_undefined)
 
 
 @attr_extensions.with_copy
@@ -340,11 +376,10 @@ class Command(snowflakes.Unique):
 class InteractionChannel(channels.PartialChannel):
     """Represents partial channels returned as resolved entities on interactions."""
 
-    permissions: permissions_.Permissions = attr.field(eq=False, hash=False, repr=True)
+    permissions: permissions_.Permissions = attr.field(repr=True)
     """Permissions the command's executor has in this channel."""
 
 
-@attr_extensions.with_copy
 @attr.define(hash=False, kw_only=True, weakref_slot=False)
 class ResolvedOptionData:
     """Represents the resolved objects of entities referenced in a command's options."""
@@ -361,13 +396,48 @@ class ResolvedOptionData:
     channels: typing.Mapping[snowflakes.Snowflake, InteractionChannel] = attr.field(repr=False)
     """Mapping of snowflake iDs to the resolved option partial channel objects."""
 
+    _by_id: typing.Mapping[snowflakes.Snowflake, typing.Union[users_.User, guilds.Role, InteractionChannel]] = (
+        attr.field(init=False, default=None, eq=False, repr=False)
+    )
+
+    def __attrs_post_init__(self) -> None:
+        # Merged once here so resolve only ever probes one dict. Members
+        # shadow users for IDs which resolved to both.
+        by_id: typing.Dict[snowflakes.Snowflake, typing.Union[users_.User, guilds.Role, InteractionChannel]] = {}
+        by_id.update(self.channels)
+        by_id.update(self.roles)
+        by_id.update(self.users)
+        by_id.update(self.members)
+        self._by_id = by_id
+
+    def resolve(
+        self, snowflake: snowflakes.Snowflake
+    ) -> typing.Union[users_.User, guilds.Role, InteractionChannel, None]:
+        """Get the entity a command option resolved to by its ID.
+
+        This is useful for `OptionType.MENTIONABLE` options, where the value
+        may refer to a user, member, role or channel.
+
+        Parameters
+        ----------
+        snowflake : hikari.snowflakes.Snowflake
+            ID of the entity to look up.
+
+        Returns
+        -------
+        typing.Union[hikari.users.User, hikari.guilds.Role, InteractionChannel, builtins.None]
+            The resolved entity, or `builtins.None` if the ID didn't resolve.
+            For IDs which resolved to both a member and a user this returns
+            the `hikari.interactions.bases.InteractionMember`.
+        """
+        return self._by_id.get(snowflake)
+
 
-@attr_extensions.with_copy
 @attr.define(hash=False, kw_only=True, weakref_slot=False)
 class CommandInteractionOption:
     """Represents the options passed for a command interaction."""
 
-    name: str = attr.field(repr=True)
+    name: str = attr.field(converter=sys.intern, repr=True)
     """Name of this option."""
 
     type: typing.Union[OptionType, int] = attr.field(repr=True)
@@ -391,22 +461,40 @@ class CommandInteractionOption:
     subcommand or group.
     """
 
+    def walk_options(self) -> typing.Iterator[CommandInteractionOption]:
+        """Iterate over this option and all the options nested under it.
+
+        The walk is depth-first and is driven by an explicit stack rather
+        than recursive calls to keep deeply nested subcommand trees cheap.
+
+        Returns
+        -------
+        typing.Iterator[CommandInteractionOption]
+            Iterator of this option followed by its descendants.
+        """
+        stack = [self]
+        while stack:
+            option = stack.pop()
+            yield option
+            if option.options:
+                stack.extend(reversed(option.options))
+
 
 @attr_extensions.with_copy
-@attr.define(hash=True, kw_only=True, weakref_slot=False)
+@attr.define(eq=False, hash=False, kw_only=True, weakref_slot=False)
 class CommandInteraction(bases.MessageResponseMixin[CommandResponseTypesT]):
     """Represents a command interaction on Discord."""
 
-    channel_id: snowflakes.Snowflake = attr.field(eq=False, hash=False, repr=True)
+    channel_id: snowflakes.Snowflake = attr.field(repr=True)
     """ID of the channel this command interaction event was triggered in."""
 
-    guild_id: typing.Optional[snowflakes.Snowflake] = attr.field(eq=False, hash=False, repr=True)
+    guild_id: typing.Optional[snowflakes.Snowflake] = attr.field(repr=True)
     """ID of the guild this command interaction event was triggered in.
 
     This will be `builtins.None` for command interactions triggered in DMs.
     """
 
-    member: typing.Optional[bases.InteractionMember] = attr.field(eq=False, hash=False, repr=True)
+    member: typing.Optional[bases.InteractionMember] = attr.field(repr=True)
     """The member who triggered this command interaction.
 
     This will be `builtins.None` for command interactions triggered in DMs.
@@ -416,21 +504,100 @@ class CommandInteraction(bases.MessageResponseMixin[CommandResponseTypesT]):
         contains the member's permissions in the current channel.
     """
 
-    user: users_.User = attr.field(eq=False, hash=False, repr=True)
+    user: users_.User = attr.field(repr=True)
     """The user who triggered this command interaction."""
 
-    command_id: snowflakes.Snowflake = attr.field(eq=False, hash=False, repr=True)
+    command_id: snowflakes.Snowflake = attr.field(repr=True)
     """ID of the command being invoked."""
 
-    command_name: str = attr.field(eq=False, hash=False, repr=True)
+    command_name: str = attr.field(converter=sys.intern, repr=True)
     """Name of the command being invoked."""
 
-    options: typing.Optional[typing.Sequence[CommandInteractionOption]] = attr.field(eq=False, hash=False, repr=True)
+    options: typing.Optional[typing.Sequence[CommandInteractionOption]] = attr.field(repr=True)
     """Parameter values provided by the user invoking this command."""
 
-    resolved: typing.Optional[ResolvedOptionData] = attr.field(eq=False, hash=False, repr=False)
+    resolved: typing.Optional[ResolvedOptionData] = attr.field(repr=False)
     """Mappings of the objects resolved for the provided command options."""
 
+    def __repr__(self) -> str:
+        # Hand-written instead of attrs-generated to skip the reflective
+        # field walk; keep in sync with the repr=True fields above.
+        return (
+            f"CommandInteraction(id={self.id!r}, type={self.type!r}, version={self.version!r}, "
+            f"channel_id={self.channel_id!r}, guild_id={self.guild_id!r}, member={self.member!r}, "
+            f"user={self.user!r}, command_id={self.command_id!r}, command_name={self.command_name!r}, "
+            f"options={self.options!r})"
+        )
+
+    def __getstate__(self) -> typing.Tuple[typing.Any, ...]:
+        # A plain value tuple pickles faster than the reflective slot-dict
+        # state attrs would otherwise build; keep in sync with the fields.
+        return (
+            self.app,
+            self.id,
+            self.application_id,
+            self.type,
+            self.token,
+            self.version,
+            self.channel_id,
+            self.guild_id,
+            self.member,
+            self.user,
+            self.command_id,
+            self.command_name,
+            self.options,
+            self.resolved,
+        )
+
+    def __setstate__(self, state: typing.Tuple[typing.Any, ...]) -> None:
+        (
+            self.app,
+            self.id,
+            self.application_id,
+            self.type,
+            self.token,
+            self.version,
+            self.channel_id,
+            self.guild_id,
+            self.member,
+            self.user,
+            self.command_id,
+            self.command_name,
+            self.options,
+            self.resolved,
+        ) = state
+
+    def as_kwargs(self) -> typing.Dict[str, typing.Union[str, int, bool, float, None]]:
+        """Flatten the options provided for this interaction into a mapping.
+
+        Subcommand and subcommand group layers are descended into, leaving
+        only the leaf parameter values keyed by option name, ready to be
+        splatted into a command callback.
+
+        Returns
+        -------
+        typing.Dict[builtins.str, typing.Union[builtins.str, builtins.int, builtins.bool, builtins.float, builtins.None]]
+            Mapping of option name to the value provided for it.
+        """
+        kwargs: typing.Dict[str, typing.Union[str, int, bool, float, None]] = {}
+        if self.options:
+            # As in walk_options, the reversals keep the mapping's insertion
+            # order aligned with the payload order of the options.
+            stack = list(reversed(self.options))
+            while stack:
+                option = stack.pop()
+                # Descend based on the option's type rather than its options
+                # field as the entity factory leaves options as None for a
+                # parameterless subcommand, which is not itself a parameter.
+                if option.type == OptionType.SUB_COMMAND or option.type == OptionType.SUB_COMMAND_GROUP:
+                    if option.options:
+                        stack.extend(reversed(option.options))
+
+                else:
+                    kwargs[option.name] = option.value
+
+        return kwargs
+
     def build_response(self) -> special_endpoints.InteractionMessageBuilder:
         """Get a message response builder for use in the REST server flow.
 
@@ -456,7 +623,7 @@ class CommandInteraction(bases.MessageResponseMixin[CommandResponseTypesT]):
         hikari.api.special_endpoints.InteractionMessageBuilder
             Interaction message response builder object.
         """
-        return self.app.rest.interaction_message_builder(bases.ResponseType.MESSAGE_CREATE)
+        return self.app.rest.interaction_message_builder(_MESSAGE_CREATE)
 
     def build_deferred_response(self) -> special_endpoints.InteractionDeferredBuilder:
         """Get a deferred message response builder for use in the REST server flow.
@@ -476,14 +643,14 @@ class CommandInteraction(bases.MessageResponseMixin[CommandResponseTypesT]):
         hikari.api.special_endpoints.InteractionMessageBuilder
             Deferred interaction message response builder object.
         """
-        return self.app.rest.interaction_deferred_builder(bases.ResponseType.DEFERRED_MESSAGE_CREATE)
+        return self.app.rest.interaction_deferred_builder(_DEFERRED_MESSAGE_CREATE)
 
-    async def fetch_channel(self) -> channels.TextChannel:
+    async def fetch_channel(self) -> channels.TextableChannel:
         """Fetch the guild channel this was triggered in.
 
         Returns
         -------
-        hikari.channels.TextChannel
+        hikari.channels.TextableChannel
             The requested partial channel derived object of the channel this was
             triggered in.
 
@@ -509,144 +676,8 @@ class CommandInteraction(bases.MessageResponseMixin[CommandResponseTypesT]):
         hikari.errors.InternalServerError
             If an internal error occurs on Discord while handling the request.
         """
-        return await self.app.rest.fetch_interaction_response(self.application_id, self.token)
-
-    async def create_initial_response(
-        self,
-        response_type: CommandResponseTypesT,
-        content: undefined.UndefinedOr[typing.Any] = undefined.UNDEFINED,
-        *,
-        flags: typing.Union[int, messages.MessageFlag, undefined.UndefinedType] = undefined.UNDEFINED,
-        tts: undefined.UndefinedOr[bool] = undefined.UNDEFINED,
-        embed: undefined.UndefinedOr[embeds_.Embed] = undefined.UNDEFINED,
-        embeds: undefined.UndefinedOr[typing.Sequence[embeds_.Embed]] = undefined.UNDEFINED,
-        mentions_everyone: undefined.UndefinedOr[bool] = undefined.UNDEFINED,
-        user_mentions: undefined.UndefinedOr[
-            typing.Union[snowflakes.SnowflakeishSequence[users_.PartialUser], bool]
-        ] = undefined.UNDEFINED,
-        role_mentions: undefined.UndefinedOr[
-            typing.Union[snowflakes.SnowflakeishSequence[guilds.PartialRole], bool]
-        ] = undefined.UNDEFINED,
-    ) -> None:
-        """Create the initial response for this interaction.
-
-        !!! warning
-            Calling this on an interaction which already has an initial
-            response will result in this raising a `hikari.errors.NotFoundError`.
-            This includes if the REST interaction server has already responded
-            to the request.
-
-        Parameters
-        ----------
-        response_type : typing.Union[builtins.int, CommandResponseTypesT]
-            The type of interaction response this is.
-
-        Other Parameters
-        ----------------
-        content : hikari.undefined.UndefinedOr[typing.Any]
-            If provided, the message contents. If
-            `hikari.undefined.UNDEFINED`, then nothing will be sent
-            in the content. Any other value here will be cast to a
-            `builtins.str`.
-
-            If this is a `hikari.embeds.Embed` and no `embed` nor `embeds` kwarg
-            is provided, then this will instead update the embed. This allows
-            for simpler syntax when sending an embed alone.
-        embed : hikari.undefined.UndefinedOr[hikari.embeds.Embed]
-            If provided, the message embed.
-        embeds : hikari.undefined.UndefinedOr[typing.Sequence[hikari.embeds.Embed]]
-            If provided, the message embeds.
-        flags : typing.Union[builtins.int, hikari.messages.MessageFlag, hikari.undefined.UndefinedType]
-            If provided, the message flags this response should have.
-
-            As of writing the only message flag which can be set here is
-            `hikari.messages.MessageFlag.EPHEMERAL`.
-        tts : hikari.undefined.UndefinedOr[builtins.bool]
-            If provided, whether the message will be read out by a screen
-            reader using Discord's TTS (text-to-speech) system.
-        mentions_everyone : hikari.undefined.UndefinedOr[builtins.bool]
-            If provided, whether the message should parse @everyone/@here
-            mentions.
-        user_mentions : hikari.undefined.UndefinedOr[typing.Union[hikari.snowflakes.SnowflakeishSequence[hikari.users.PartialUser], builtins.bool]]
-            If provided, and `builtins.True`, all user mentions will be detected.
-            If provided, and `builtins.False`, all user mentions will be ignored
-            if appearing in the message body.
-            Alternatively this may be a collection of
-            `hikari.snowflakes.Snowflake`, or
-            `hikari.users.PartialUser` derivatives to enforce mentioning
-            specific users.
-        role_mentions : hikari.undefined.UndefinedOr[typing.Union[hikari.snowflakes.SnowflakeishSequence[hikari.guilds.PartialRole], builtins.bool]]
-            If provided, and `builtins.True`, all role mentions will be detected.
-            If provided, and `builtins.False`, all role mentions will be ignored
-            if appearing in the message body.
-            Alternatively this may be a collection of
-            `hikari.snowflakes.Snowflake`, or
-            `hikari.guilds.PartialRole` derivatives to enforce mentioning
-            specific roles.
-
-        Raises
-        ------
-        builtins.ValueError
-            If more than 100 unique objects/entities are passed for
-            `role_mentions` or `user_mentions`.
-        builtins.TypeError
-            If both `embed` and `embeds` are specified.
-        hikari.errors.BadRequestError
-            This may be raised in several discrete situations, such as messages
-            being empty with no embeds; messages with more than
-            2000 characters in them, embeds that exceed one of the many embed
-            limits; invalid image URLs in embeds.
-        hikari.errors.UnauthorizedError
-            If you are unauthorized to make the request (invalid/missing token).
-        hikari.errors.NotFoundError
-            If the interaction is not found or if the interaction's initial
-            response has already been created.
-        hikari.errors.RateLimitTooLongError
-            Raised in the event that a rate limit occurs that is
-            longer than `max_rate_limit` when making a request.
-        hikari.errors.RateLimitedError
-            Usually, Hikari will handle and retry on hitting
-            rate-limits automatically. This includes most bucket-specific
-            rate-limits and global rate-limits. In some rare edge cases,
-            however, Discord implements other undocumented rules for
-            rate-limiting, such as limits per attribute. These cannot be
-            detected or handled normally by Hikari due to their undocumented
-            nature, and will trigger this exception if they occur.
-        hikari.errors.InternalServerError
-            If an internal error occurs on Discord while handling the request.
-        """  # noqa: E501 - Line too long
-        await self.app.rest.create_interaction_response(
-            self.id,
-            self.token,
-            response_type,
-            content,
-            tts=tts,
-            embed=embed,
-            embeds=embeds,
-            flags=flags,
-            mentions_everyone=mentions_everyone,
-            user_mentions=user_mentions,
-            role_mentions=role_mentions,
-        )
-
-    async def edit_initial_response(
-        self,
-        content: undefined.UndefinedNoneOr[typing.Any] = undefined.UNDEFINED,
-        *,
-        embed: undefined.UndefinedNoneOr[embeds_.Embed] = undefined.UNDEFINED,
-        embeds: undefined.UndefinedNoneOr[typing.Sequence[embeds_.Embed]] = undefined.UNDEFINED,
-        attachment: undefined.UndefinedOr[files.Resourceish] = undefined.UNDEFINED,
-        attachments: undefined.UndefinedOr[typing.Sequence[files.Resourceish]] = undefined.UNDEFINED,
-        replace_attachments: bool = False,
-        mentions_everyone: undefined.UndefinedOr[bool] = undefined.UNDEFINED,
-        user_mentions: undefined.UndefinedOr[
-            typing.Union[snowflakes.SnowflakeishSequence[users_.PartialUser], bool]
-        ] = undefined.UNDEFINED,
-        role_mentions: undefined.UndefinedOr[
-            typing.Union[snowflakes.SnowflakeishSequence[guilds.PartialRole], bool]
-        ] = undefined.UNDEFINED,
-    ) -> messages.Message:
-        """Edit the initial response of this command interaction.
+        channel = await self.app.rest.fetch_channel(self.channel_id)
+        return typing.cast("channels.TextableChannel", channel)
 
     def get_channel(self) -> typing.Union[channels.GuildTextChannel, channels.GuildNewsChannel, None]:
         """Get the guild channel this was triggered in from the cache.
@@ -663,8 +694,7 @@ class CommandInteraction(bases.MessageResponseMixin[CommandResponseTypesT]):
         """
         if isinstance(self.app, traits.CacheAware):
             channel = self.app.cache.get_guild_channel(self.channel_id)
-            assert isinstance(channel, (channels.GuildTextChannel, channels.GuildNewsChannel))
-            return channel
+            return typing.cast("typing.Union[channels.GuildTextChannel, channels.GuildNewsChannel, None]", channel)
 
         return None
 
@@ -699,7 +729,9 @@ class CommandInteraction(bases.MessageResponseMixin[CommandResponseTypesT]):
             If an internal error occurs on Discord while handling the request.
         """
         return await self.app.rest.fetch_application_command(
-            application=self.application_id, command=self.id, guild=self.guild_id or undefined.UNDEFINED
+            application=self.application_id,
+            command=self.id,
+            guild=undefined.UNDEFINED if self.guild_id is None else self.guild_id,
         )
 
     async def fetch_guild(self) -> typing.Optional[guilds.RESTGuild]:
@@ -733,7 +765,7 @@ class CommandInteraction(bases.MessageResponseMixin[CommandResponseTypesT]):
         hikari.errors.InternalServerError
             If an internal error occurs on Discord while handling the request.
         """
-        if not self.guild_id:
+        if self.guild_id is None:
             return None
 
         return await self.app.rest.fetch_guild(self.guild_id)
@@ -746,7 +778,7 @@ class CommandInteraction(bases.MessageResponseMixin[CommandResponseTypesT]):
         typing.Optional[hikari.guilds.GatewayGuild]
             The object of the guild if found, else `builtins.None`.
         """
-        if self.guild_id and isinstance(self.app, traits.CacheAware):
+        if self.guild_id is not None and isinstance(self.app, traits.CacheAware):
             return self.app.cache.get_guild(self.guild_id)
 
         return None
@@ -21,6 +21,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 """Models and enums used for Discord's Components interaction flow."""
+
 from __future__ import annotations
 
 __all__: typing.Sequence[str] = [
@@ -91,14 +92,14 @@ The following types are valid for this:
 """
 
 
-@attr.define(hash=True, weakref_slot=False)
+@attr.define(eq=False, hash=False, weakref_slot=False)
 class ComponentInteraction(bases.MessageResponseMixin[ComponentResponseTypesT]):
     """Represents a component interaction on Discord."""
 
-    channel_id: snowflakes.Snowflake = attr.field(eq=False)
+    channel_id: snowflakes.Snowflake = attr.field()
     """ID of the channel this interaction was triggered in."""
 
-    component_type: typing.Union[messages.ComponentType, int] = attr.field(eq=False)
+    component_type: typing.Union[messages.ComponentType, int] = attr.field()
     """The type of component which triggers this interaction.
 
     !!! note
@@ -106,28 +107,28 @@ class ComponentInteraction(bases.MessageResponseMixin[ComponentResponseTypesT]):
         interactions.
     """
 
-    custom_id: str = attr.field(eq=False)
+    custom_id: str = attr.field()
     """Developer defined ID of the component which triggered this interaction."""
 
-    guild_id: typing.Optional[snowflakes.Snowflake] = attr.field(eq=False)
+    guild_id: typing.Optional[snowflakes.Snowflake] = attr.field()
     """ID of the guild this interaction was triggered in.
 
     This will be `builtins.None` for command interactions triggered in DMs.
     """
-    message: typing.Optional[messages.Message] = attr.field(eq=False, repr=False)
+    message: typing.Optional[messages.Message] = attr.field(repr=False)
     """Object of the message the components for this interaction are attached to.
 
     !!! note
         This will be `builtins.None` for ephemeral message component interactions.
     """
 
-    message_id: snowflakes.Snowflake = attr.field(eq=False, repr=False)
+    message_id: snowflakes.Snowflake = attr.field(repr=False)
     """ID of the message the components for this interaction are attached to."""
 
-    message_flags: messages.MessageFlag = attr.field(eq=False, repr=False)
+    message_flags: messages.MessageFlag = attr.field(repr=False)
     """Flags of the message the components for this interaction are attached to."""
 
-    member: typing.Optional[bases.InteractionMember] = attr.field(eq=False, hash=False, repr=True)
+    member: typing.Optional[bases.InteractionMember] = attr.field(repr=True)
     """The member who triggered this interaction.
 
     This will be `builtins.None` for interactions triggered in DMs.
@@ -137,7 +138,7 @@ class ComponentInteraction(bases.MessageResponseMixin[ComponentResponseTypesT]):
         contains the member's permissions in the current channel.
     """
 
-    user: users.User = attr.field(eq=False, hash=False, repr=True)
+    user: users.User = attr.field(repr=True)
     """The user who triggered this interaction."""
 
     def build_response(self, type_: _ImmediateTypesT, /) -> special_endpoints.InteractionMessageBuilder:
@@ -213,13 +214,13 @@ class ComponentInteraction(bases.MessageResponseMixin[ComponentResponseTypesT]):
 
         return self.app.rest.interaction_deferred_builder(type_)
 
-    async def fetch_channel(self) -> channels.TextChannel:
+    async def fetch_channel(self) -> channels.TextableChannel:
         """Fetch the channel this interaction occurred in.
 
         Returns
         -------
-        hikari.channels.TextChannel
-            The channel. This will be a _derivative_ of `hikari.channels.TextChannel`.
+        hikari.channels.TextableChannel
+            The channel. This will be a _derivative_ of `hikari.channels.TextableChannel`.
 
         Raises
         ------
@@ -247,8 +248,7 @@ class ComponentInteraction(bases.MessageResponseMixin[ComponentResponseTypesT]):
             If an internal error occurs on Discord while handling the request.
         """
         channel = await self.app.rest.fetch_channel(self.channel_id)
-        assert isinstance(channel, channels.TextChannel)
-        return channel
+        return typing.cast("channels.TextableChannel", channel)
 
     def get_channel(self) -> typing.Union[channels.GuildTextChannel, channels.GuildNewsChannel, None]:
         """Get the guild channel this interaction occurred in.
@@ -265,8 +265,7 @@ class ComponentInteraction(bases.MessageResponseMixin[ComponentResponseTypesT]):
         """
         if isinstance(self.app, traits.CacheAware):
             channel = self.app.cache.get_guild_channel(self.channel_id)
-            assert isinstance(channel, (channels.GuildTextChannel, channels.GuildNewsChannel))
-            return channel
+            return typing.cast("typing.Union[channels.GuildTextChannel, channels.GuildNewsChannel, None]", channel)
 
         return None
 
@@ -301,7 +300,7 @@ class ComponentInteraction(bases.MessageResponseMixin[ComponentResponseTypesT]):
         hikari.errors.InternalServerError
             If an internal error occurs on Discord while handling the request.
         """
-        if not self.guild_id:
+        if self.guild_id is None:
             return None
 
         return await self.app.rest.fetch_guild(self.guild_id)
@@ -314,7 +313,7 @@ class ComponentInteraction(bases.MessageResponseMixin[ComponentResponseTypesT]):
         typing.Optional[hikari.guilds.GatewayGuild]
             The object of the guild if found, else `builtins.None`.
         """
-        if self.guild_id and isinstance(self.app, traits.CacheAware):
+        if self.guild_id is not None and isinstance(self.app, traits.CacheAware):
             return self.app.cache.get_guild(self.guild_id)
 
         return None
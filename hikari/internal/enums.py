@@ -21,6 +21,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 """Implementation of parts of Python's `enum` protocol to be more performant."""
+
 from __future__ import annotations
 
 __all__: typing.List[str] = ["Enum", "Flag"]
@@ -101,6 +102,14 @@ _Enum = NotImplemented
 
 class _EnumMeta(type):
     def __call__(cls, value: typing.Any) -> typing.Any:
+        members = cls._value_to_member_list_
+        if members is not None and isinstance(value, int):
+            # Indexing the flat list is measurably faster than probing the
+            # dict for the dense int enums this gets built for.
+            if 0 <= value < len(members):
+                return members[value]
+            return value
+
         try:
             return cls._value_to_member_map_[value]
         except KeyError:
@@ -170,6 +179,20 @@ class _EnumMeta(type):
             member_names.append(name)
             setattr(cls, name, member)
 
+        # Most of the int-based enums in this library have small, dense values
+        # (e.g. a contiguous 1..n range), so where possible the members are
+        # also laid out in a flat list indexed directly by value. This turns
+        # the cast in __call__ into a list subscript rather than a dict probe.
+        # Gaps hold the plain int of their index, which is what __call__ would
+        # return for an undocumented value anyway.
+        if value_to_member and all(isinstance(value, int) and 0 <= value < 64 for value in value_to_member):
+            member_list = list(range(max(value_to_member) + 1))
+            for value, member in value_to_member.items():
+                member_list[value] = member
+            cls._value_to_member_list_ = tuple(member_list)
+        else:
+            cls._value_to_member_list_ = None
+
         return cls
 
     @classmethod
@@ -272,6 +295,7 @@ class Enum(metaclass=_EnumMeta):
 
     _name_to_member_map_: typing.Final[typing.ClassVar[typing.Mapping[str, Enum]]]
     _value_to_member_map_: typing.Final[typing.ClassVar[typing.Mapping[int, Enum]]]
+    _value_to_member_list_: typing.Final[typing.ClassVar[typing.Optional[typing.Sequence[Enum]]]]
     _member_names_: typing.Final[typing.ClassVar[typing.Sequence[str]]]
     __members__: typing.Final[typing.ClassVar[typing.Mapping[str, Enum]]]
     __objtype__: typing.Final[typing.ClassVar[typing.Type[typing.Any]]]
@@ -20,6 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 """Pytest integration."""
+
 import os
 
 from pipelines import config
@@ -29,6 +30,12 @@ RUN_FLAGS = [
     "-c",
     config.PYTEST_INI,
     "--showlocals",
+    # Shard tests across CPU cores; the tests are all in-process and
+    # mock-based so they parallelise cleanly. Scope-level distribution
+    # keeps each test class (and its shared fixtures) on one worker.
+    "-n",
+    "auto",
+    "--dist=loadscope",
 ]
 COVERAGE_FLAGS = [
     "--cov",
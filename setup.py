@@ -55,6 +55,25 @@ def parse_requirements_file(path):
         return [d for d in dependencies if not d.startswith("#")]
 
 
+def ext_modules():
+    # Modules on the hot interaction path are compiled into C extensions when
+    # Cython is available at build time. The source modules already carry the
+    # `# cython: language_level=3` directive. The extensions are marked as
+    # optional so that installs without Cython, without a C toolchain, or
+    # where compilation fails for any other reason fall back to the
+    # pure-Python modules instead of aborting.
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+
+    extensions = cythonize([os.path.join(name, "interactions", "commands.py")], language_level=3)
+    for extension in extensions:
+        extension.optional = True
+
+    return extensions
+
+
 metadata = parse_meta()
 
 setuptools.setup(
@@ -76,6 +95,7 @@ setuptools.setup(
         "CI": metadata.ci,
     },
     packages=setuptools.find_namespace_packages(include=[name + "*"]),
+    ext_modules=ext_modules(),
     python_requires=">=3.8.0,<3.11",
     install_requires=parse_requirements_file("requirements.txt"),
     extras_require={
@@ -98,6 +98,19 @@ def mock_class_namespace(
     return type(name, (klass,), namespace)
 
 
+def assert_awaited_once_with(mock_, *args: typing.Any, **kwargs: typing.Any):
+    """Cheaper equivalent of `AsyncMock.assert_awaited_once_with`.
+
+    This compares `await_args` directly rather than going through mock's
+    internal `_Call` reconstruction, which adds up in the hotter test
+    modules.
+    """
+    assert mock_.await_count == 1, f"Expected mock to have been awaited once. Awaited {mock_.await_count} times."
+    assert (
+        mock_.await_args.args == args and mock_.await_args.kwargs == kwargs
+    ), f"expected await: {mock.call(*args, **kwargs)}\nactual await: {mock_.await_args}"
+
+
 def retry(max_retries):
     def decorator(func):
         assert asyncio.iscoroutinefunction(func), "retry only supports coroutine functions currently"
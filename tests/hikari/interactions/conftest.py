@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2020 Nekokatt
+# Copyright (c) 2021 davfsa
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import mock
+import pytest
+
+from hikari import traits
+
+
+@pytest.fixture(scope="session")
+def _mock_app_proto():
+    # Constructing a spec'd mock walks the whole protocol, so build it once
+    # per session and re-arm the same object for each test.
+    app = mock.Mock(traits.CacheAware, rest=mock.AsyncMock())
+    # Pre-create the child mocks for the routes the interaction tests hit so
+    # they aren't lazily built on first attribute access mid-test.
+    app.rest.fetch_application_command = mock.AsyncMock()
+    app.rest.edit_application_command = mock.AsyncMock()
+    app.rest.delete_application_command = mock.AsyncMock()
+    app.rest.fetch_channel = mock.AsyncMock()
+    app.rest.fetch_guild = mock.AsyncMock()
+    app.rest.fetch_interaction_response = mock.AsyncMock()
+    app.rest.create_interaction_response = mock.AsyncMock()
+    app.rest.edit_interaction_response = mock.AsyncMock()
+    app.rest.delete_interaction_response = mock.AsyncMock()
+    # These two return builders synchronously, so plain Mocks.
+    app.rest.interaction_message_builder = mock.Mock()
+    app.rest.interaction_deferred_builder = mock.Mock()
+    return app
+
+
+@pytest.fixture()
+def mock_app(_mock_app_proto):
+    _mock_app_proto.reset_mock(return_value=True, side_effect=True)
+    return _mock_app_proto
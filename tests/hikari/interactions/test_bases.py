@@ -20,19 +20,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import mock
 import pytest
 
-from hikari import traits
 from hikari import undefined
 from hikari.interactions import bases
 
 
-@pytest.fixture()
-def mock_app():
-    return mock.Mock(traits.CacheAware, rest=mock.AsyncMock())
-
-
 class TestPartialInteraction:
     @pytest.fixture()
     def mock_partial_interaction(self, mock_app):
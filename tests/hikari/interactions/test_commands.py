@@ -19,64 +19,183 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import copy
+import pickle
+
 import mock
 import pytest
 
-from hikari import channels
 from hikari import snowflakes
-from hikari import traits
 from hikari import undefined
 from hikari.interactions import bases
 from hikari.interactions import commands
+from tests.hikari import hikari_test_helpers
+
+# Snowflake IDs used by the fixtures below, built once at import time so the
+# fixtures don't re-run Snowflake.__new__ per test.
+_COMMAND_ID = snowflakes.Snowflake(34123123)
+_APPLICATION_ID = snowflakes.Snowflake(65234123)
+_GUILD_ID = snowflakes.Snowflake(31231235)
+_INTERACTION_ID = snowflakes.Snowflake(2312312)
+_INTERACTION_CHANNEL_ID = snowflakes.Snowflake(3123123)
+_INTERACTION_GUILD_ID = snowflakes.Snowflake(5412231)
+_INTERACTION_APPLICATION_ID = snowflakes.Snowflake(43123)
+
+# Expected awaits for Command.edit with no optional arguments, built once so
+# the tests don't materialise a fresh mock.call per invocation.
+_EDIT_GUILD_CALL = mock.call(
+    65234123, 34123123, 31231235, name=undefined.UNDEFINED, description=undefined.UNDEFINED, options=undefined.UNDEFINED
+)
+_EDIT_DM_CALL = mock.call(
+    65234123,
+    34123123,
+    undefined.UNDEFINED,
+    name=undefined.UNDEFINED,
+    description=undefined.UNDEFINED,
+    options=undefined.UNDEFINED,
+)
+
+_APPLICATION_COMMAND = bases.InteractionType.APPLICATION_COMMAND
+_MESSAGE_CREATE = bases.ResponseType.MESSAGE_CREATE
+_DEFERRED_MESSAGE_CREATE = bases.ResponseType.DEFERRED_MESSAGE_CREATE
+
+
+class TestCommandOption:
+    def test_walk_options(self):
+        nested_option = commands.CommandOption(
+            type=commands.OptionType.STRING, name="value", description="meow", is_required=True
+        )
+        other_nested_option = commands.CommandOption(
+            type=commands.OptionType.USER, name="user", description="nyaa", is_required=False
+        )
+        sub_command = commands.CommandOption(
+            type=commands.OptionType.SUB_COMMAND,
+            name="set",
+            description="ok",
+            is_required=False,
+            options=[nested_option, other_nested_option],
+        )
+        other_sub_command = commands.CommandOption(
+            type=commands.OptionType.SUB_COMMAND, name="get", description="ok", is_required=False
+        )
+        group = commands.CommandOption(
+            type=commands.OptionType.SUB_COMMAND_GROUP,
+            name="config",
+            description="ok",
+            is_required=False,
+            options=[sub_command, other_sub_command],
+        )
 
+        assert list(group.walk_options()) == [
+            group,
+            sub_command,
+            nested_option,
+            other_nested_option,
+            other_sub_command,
+        ]
 
-@pytest.fixture()
-def mock_app():
-    return mock.Mock(traits.CacheAware, rest=mock.AsyncMock())
+
+class TestCommandInteractionOption:
+    def test_walk_options(self):
+        nested_option = commands.CommandInteractionOption(
+            type=commands.OptionType.STRING, name="value", value="meow", options=None
+        )
+        sub_command = commands.CommandInteractionOption(
+            type=commands.OptionType.SUB_COMMAND, name="set", value=None, options=[nested_option]
+        )
+        group = commands.CommandInteractionOption(
+            type=commands.OptionType.SUB_COMMAND_GROUP, name="config", value=None, options=[sub_command]
+        )
+
+        assert list(group.walk_options()) == [group, sub_command, nested_option]
+
+
+class TestResolvedOptionData:
+    def test_resolve(self):
+        mock_member = object()
+        mock_role = object()
+        mock_channel = object()
+        resolved = commands.ResolvedOptionData(
+            users={snowflakes.Snowflake(54123): object()},
+            members={snowflakes.Snowflake(54123): mock_member},
+            roles={snowflakes.Snowflake(6541234): mock_role},
+            channels={snowflakes.Snowflake(12353): mock_channel},
+        )
+
+        assert resolved.resolve(snowflakes.Snowflake(54123)) is mock_member
+        assert resolved.resolve(snowflakes.Snowflake(6541234)) is mock_role
+        assert resolved.resolve(snowflakes.Snowflake(12353)) is mock_channel
+        assert resolved.resolve(snowflakes.Snowflake(123321123)) is None
 
 
 class TestCommand:
-    @pytest.fixture()
-    def mock_command(self, mock_app):
+    @pytest.fixture(scope="module")
+    def _command_proto(self):
+        # Run the attrs __init__ machinery once per module; tests get a
+        # cheap shallow copy which they are free to mutate.
         return commands.Command(
-            app=mock_app,
-            id=snowflakes.Snowflake(34123123),
-            application_id=snowflakes.Snowflake(65234123),
+            app=None,
+            id=_COMMAND_ID,
+            application_id=_APPLICATION_ID,
             name="Name",
             description="very descript",
             options=[],
-            guild_id=snowflakes.Snowflake(31231235),
+            guild_id=_GUILD_ID,
         )
 
+    @pytest.fixture()
+    def mock_command(self, _command_proto, mock_app):
+        command = copy.copy(_command_proto)
+        command.app = mock_app
+        return command
+
+    def test_repr(self, _command_proto):
+        assert repr(_command_proto) == "Command(id=34123123, application_id=65234123, name='Name')"
+
+    def test_pickle_and_copy_roundtrips(self, _command_proto):
+        for roundtripped in (
+            pickle.loads(pickle.dumps(_command_proto)),
+            copy.copy(_command_proto),
+            copy.deepcopy(_command_proto),
+        ):
+            assert roundtripped == _command_proto
+            assert roundtripped.app is None
+            assert roundtripped.id == _COMMAND_ID
+            assert roundtripped.application_id == _APPLICATION_ID
+            assert roundtripped.name == "Name"
+            assert roundtripped.description == "very descript"
+            assert roundtripped.options == []
+            assert roundtripped.guild_id == _GUILD_ID
+            assert repr(roundtripped) == repr(_command_proto)
+
+    @pytest.mark.parametrize(
+        ("guild_id", "expected_guild"),
+        [(_GUILD_ID, 31231235), (None, undefined.UNDEFINED)],
+    )
     @pytest.mark.asyncio()
-    async def test_fetch_self(self, mock_command, mock_app):
-        result = await mock_command.fetch_self()
-
-        assert result is mock_app.rest.fetch_application_command.return_value
-        mock_app.rest.fetch_application_command.assert_awaited_once_with(65234123, 34123123, 31231235)
-
-    @pytest.mark.asyncio()
-    async def test_fetch_self_when_guild_id_is_none(self, mock_command, mock_app):
-        mock_command.guild_id = None
+    async def test_fetch_self(self, mock_command, mock_app, guild_id, expected_guild):
+        mock_command.guild_id = guild_id
 
         result = await mock_command.fetch_self()
 
         assert result is mock_app.rest.fetch_application_command.return_value
-        mock_app.rest.fetch_application_command.assert_awaited_once_with(65234123, 34123123, undefined.UNDEFINED)
+        hikari_test_helpers.assert_awaited_once_with(
+            mock_app.rest.fetch_application_command, 65234123, 34123123, expected_guild
+        )
 
+    @pytest.mark.parametrize(
+        ("guild_id", "expected_call"),
+        [(_GUILD_ID, _EDIT_GUILD_CALL), (None, _EDIT_DM_CALL)],
+    )
     @pytest.mark.asyncio()
-    async def test_edit_without_optional_args(self, mock_command, mock_app):
+    async def test_edit_without_optional_args(self, mock_command, mock_app, guild_id, expected_call):
+        mock_command.guild_id = guild_id
+
         result = await mock_command.edit()
 
         assert result is mock_app.rest.edit_application_command.return_value
-        mock_app.rest.edit_application_command.assert_awaited_once_with(
-            65234123,
-            34123123,
-            31231235,
-            name=undefined.UNDEFINED,
-            description=undefined.UNDEFINED,
-            options=undefined.UNDEFINED,
-        )
+        assert mock_app.rest.edit_application_command.await_count == 1
+        assert mock_app.rest.edit_application_command.await_args == expected_call
 
     @pytest.mark.asyncio()
     async def test_edit_with_optional_args(self, mock_command, mock_app):
@@ -84,91 +203,162 @@ class TestCommand:
         result = await mock_command.edit(name="new name", description="very descrypt", options=[mock_option])
 
         assert result is mock_app.rest.edit_application_command.return_value
-        mock_app.rest.edit_application_command.assert_awaited_once_with(
-            65234123, 34123123, 31231235, name="new name", description="very descrypt", options=[mock_option]
-        )
-
-    @pytest.mark.asyncio()
-    async def test_edit_when_guild_id_is_none(self, mock_command, mock_app):
-        mock_command.guild_id = None
-
-        result = await mock_command.edit()
-
-        assert result is mock_app.rest.edit_application_command.return_value
-        mock_app.rest.edit_application_command.assert_awaited_once_with(
+        hikari_test_helpers.assert_awaited_once_with(
+            mock_app.rest.edit_application_command,
             65234123,
             34123123,
-            undefined.UNDEFINED,
-            name=undefined.UNDEFINED,
-            description=undefined.UNDEFINED,
-            options=undefined.UNDEFINED,
+            31231235,
+            name="new name",
+            description="very descrypt",
+            options=[mock_option],
         )
 
+    @pytest.mark.parametrize(
+        ("guild_id", "expected_guild"),
+        [(_GUILD_ID, 31231235), (None, undefined.UNDEFINED)],
+    )
     @pytest.mark.asyncio()
-    async def test_delete(self, mock_command, mock_app):
-        await mock_command.delete()
-
-        mock_app.rest.delete_application_command.assert_awaited_once_with(65234123, 34123123, 31231235)
-
-    @pytest.mark.asyncio()
-    async def test_delete_when_guild_id_is_none(self, mock_command, mock_app):
-        mock_command.guild_id = None
+    async def test_delete(self, mock_command, mock_app, guild_id, expected_guild):
+        mock_command.guild_id = guild_id
 
         await mock_command.delete()
 
-        mock_app.rest.delete_application_command.assert_awaited_once_with(65234123, 34123123, undefined.UNDEFINED)
+        hikari_test_helpers.assert_awaited_once_with(
+            mock_app.rest.delete_application_command, 65234123, 34123123, expected_guild
+        )
 
 
 class TestCommandInteraction:
-    @pytest.fixture()
-    def mock_command_interaction(self, mock_app):
+    @pytest.fixture(scope="module")
+    def _command_interaction_proto(self):
+        # Run the attrs __init__ machinery once per module; tests get a
+        # cheap shallow copy which they are free to mutate.
         return commands.CommandInteraction(
-            app=mock_app,
-            id=snowflakes.Snowflake(2312312),
-            type=bases.InteractionType.APPLICATION_COMMAND,
-            channel_id=snowflakes.Snowflake(3123123),
-            guild_id=snowflakes.Snowflake(5412231),
+            app=None,
+            id=_INTERACTION_ID,
+            type=_APPLICATION_COMMAND,
+            channel_id=_INTERACTION_CHANNEL_ID,
+            guild_id=_INTERACTION_GUILD_ID,
             member=object(),
             user=object(),
             token="httptptptptptptptp",
             version=1,
-            application_id=snowflakes.Snowflake(43123),
-            command_id=snowflakes.Snowflake(3123123),
+            application_id=_INTERACTION_APPLICATION_ID,
+            command_id=_INTERACTION_CHANNEL_ID,
             command_name="OKOKOK",
             options=[],
             resolved=None,
         )
 
+    @pytest.fixture()
+    def mock_command_interaction(self, _command_interaction_proto, mock_app):
+        interaction = copy.copy(_command_interaction_proto)
+        interaction.app = mock_app
+        return interaction
+
+    def test_repr(self, _command_interaction_proto):
+        proto = _command_interaction_proto
+        assert repr(proto) == (
+            f"CommandInteraction(id=2312312, type=<InteractionType.APPLICATION_COMMAND: 2>, version=1, "
+            f"channel_id=3123123, guild_id=5412231, member={proto.member!r}, user={proto.user!r}, "
+            f"command_id=3123123, command_name='OKOKOK', options=[])"
+        )
+
+    def test_pickle_and_copy_roundtrips(self, _command_interaction_proto):
+        # The member and user objects in the prototype repr with their
+        # addresses which would never survive a pickle, so blank them out.
+        interaction = copy.copy(_command_interaction_proto)
+        interaction.member = None
+        interaction.user = None
+
+        for roundtripped in (
+            pickle.loads(pickle.dumps(interaction)),
+            copy.copy(interaction),
+            copy.deepcopy(interaction),
+        ):
+            assert roundtripped == interaction
+            assert roundtripped.app is None
+            assert roundtripped.id == _INTERACTION_ID
+            assert roundtripped.application_id == _INTERACTION_APPLICATION_ID
+            assert roundtripped.type == _APPLICATION_COMMAND
+            assert roundtripped.token == "httptptptptptptptp"
+            assert roundtripped.version == 1
+            assert roundtripped.channel_id == _INTERACTION_CHANNEL_ID
+            assert roundtripped.guild_id == _INTERACTION_GUILD_ID
+            assert roundtripped.member is None
+            assert roundtripped.user is None
+            assert roundtripped.command_id == _INTERACTION_CHANNEL_ID
+            assert roundtripped.command_name == "OKOKOK"
+            assert roundtripped.options == []
+            assert roundtripped.resolved is None
+            assert repr(roundtripped) == repr(interaction)
+
+    def test_as_kwargs(self, mock_command_interaction):
+        nested_option = commands.CommandInteractionOption(
+            type=commands.OptionType.STRING, name="value", value="meow", options=None
+        )
+        other_nested_option = commands.CommandInteractionOption(
+            type=commands.OptionType.INTEGER, name="times", value=3, options=None
+        )
+        sub_command = commands.CommandInteractionOption(
+            type=commands.OptionType.SUB_COMMAND, name="set", value=None, options=[nested_option, other_nested_option]
+        )
+        group = commands.CommandInteractionOption(
+            type=commands.OptionType.SUB_COMMAND_GROUP, name="config", value=None, options=[sub_command]
+        )
+        mock_command_interaction.options = [group]
+
+        result = mock_command_interaction.as_kwargs()
+
+        assert result == {"value": "meow", "times": 3}
+        assert list(result) == ["value", "times"]
+
+    def test_as_kwargs_for_parameterless_sub_command(self, mock_command_interaction):
+        sub_command = commands.CommandInteractionOption(
+            type=commands.OptionType.SUB_COMMAND, name="reset", value=None, options=None
+        )
+        group = commands.CommandInteractionOption(
+            type=commands.OptionType.SUB_COMMAND_GROUP, name="config", value=None, options=[sub_command]
+        )
+        mock_command_interaction.options = [group]
+
+        assert mock_command_interaction.as_kwargs() == {}
+
+    def test_as_kwargs_when_no_options(self, mock_command_interaction):
+        mock_command_interaction.options = None
+
+        assert mock_command_interaction.as_kwargs() == {}
+
     def test_build_response(self, mock_command_interaction, mock_app):
-        mock_app.rest.interaction_message_builder = mock.Mock()
         builder = mock_command_interaction.build_response()
 
         assert builder is mock_app.rest.interaction_message_builder.return_value
-        mock_app.rest.interaction_message_builder.assert_called_once_with(bases.ResponseType.MESSAGE_CREATE)
+        mock_app.rest.interaction_message_builder.assert_called_once_with(_MESSAGE_CREATE)
 
     def test_build_deferred_response(self, mock_command_interaction, mock_app):
-        mock_app.rest.interaction_deferred_builder = mock.Mock()
         builder = mock_command_interaction.build_deferred_response()
 
         assert builder is mock_app.rest.interaction_deferred_builder.return_value
-        mock_app.rest.interaction_deferred_builder.assert_called_once_with(bases.ResponseType.DEFERRED_MESSAGE_CREATE)
+        mock_app.rest.interaction_deferred_builder.assert_called_once_with(_DEFERRED_MESSAGE_CREATE)
 
     @pytest.mark.asyncio()
     async def test_fetch_channel(self, mock_command_interaction, mock_app):
-        mock_app.rest.fetch_channel.return_value = mock.Mock(channels.TextChannel)
-        assert await mock_command_interaction.fetch_channel() is mock_app.rest.fetch_channel.return_value
+        mock_channel = object()
+        mock_app.rest.fetch_channel.return_value = mock_channel
+        assert await mock_command_interaction.fetch_channel() is mock_channel
 
-        mock_app.rest.fetch_channel.assert_awaited_once_with(3123123)
+        hikari_test_helpers.assert_awaited_once_with(mock_app.rest.fetch_channel, 3123123)
 
     def test_get_channel(self, mock_command_interaction, mock_app):
-        mock_app.cache.get_guild_channel.return_value = mock.Mock(channels.GuildTextChannel)
+        mock_channel = object()
+        mock_app.cache.get_guild_channel.return_value = mock_channel
 
-        assert mock_command_interaction.get_channel() is mock_app.cache.get_guild_channel.return_value
+        assert mock_command_interaction.get_channel() is mock_channel
 
         mock_app.cache.get_guild_channel.assert_called_once_with(3123123)
 
     def test_get_channel_without_cache(self, mock_command_interaction):
-        mock_command_interaction.app = mock.Mock(traits.RESTAware)
+        mock_command_interaction.app = object()
 
         assert mock_command_interaction.get_channel() is None
 
@@ -178,8 +368,8 @@ class TestCommandInteraction:
 
         assert await mock_command_interaction.fetch_command() is mock_app.rest.fetch_application_command.return_value
 
-        mock_app.rest.fetch_application_command.assert_awaited_once_with(
-            application=43123, command=2312312, guild=342123
+        hikari_test_helpers.assert_awaited_once_with(
+            mock_app.rest.fetch_application_command, application=43123, command=2312312, guild=342123
         )
 
     @pytest.mark.asyncio()
@@ -188,44 +378,40 @@ class TestCommandInteraction:
 
         assert await mock_command_interaction.fetch_command() is mock_app.rest.fetch_application_command.return_value
 
-        mock_app.rest.fetch_application_command.assert_awaited_once_with(
-            application=43123, command=2312312, guild=undefined.UNDEFINED
+        hikari_test_helpers.assert_awaited_once_with(
+            mock_app.rest.fetch_application_command, application=43123, command=2312312, guild=undefined.UNDEFINED
         )
 
+    @pytest.mark.parametrize(("guild_id", "expect_fetch"), [(43123123, True), (None, False)])
     @pytest.mark.asyncio()
-    async def test_fetch_guild(self, mock_command_interaction, mock_app):
-        mock_command_interaction.guild_id = 43123123
+    async def test_fetch_guild(self, mock_command_interaction, mock_app, guild_id, expect_fetch):
+        mock_command_interaction.guild_id = guild_id
 
-        assert await mock_command_interaction.fetch_guild() is mock_app.rest.fetch_guild.return_value
+        result = await mock_command_interaction.fetch_guild()
 
-        mock_app.rest.fetch_guild.assert_awaited_once_with(43123123)
-
-    @pytest.mark.asyncio()
-    async def test_fetch_guild_for_dm_interaction(self, mock_command_interaction, mock_app):
-        mock_command_interaction.guild_id = None
-
-        assert await mock_command_interaction.fetch_guild() is None
-
-        mock_app.rest.fetch_guild.assert_not_called()
-
-    def test_get_guild(self, mock_command_interaction, mock_app):
-        mock_command_interaction.guild_id = 874356
-
-        assert mock_command_interaction.get_guild() is mock_app.cache.get_guild.return_value
-
-        mock_app.cache.get_guild.assert_called_once_with(874356)
-
-    def test_get_guild_for_dm_interaction(self, mock_command_interaction, mock_app):
-        mock_command_interaction.guild_id = None
+        if expect_fetch:
+            assert result is mock_app.rest.fetch_guild.return_value
+            hikari_test_helpers.assert_awaited_once_with(mock_app.rest.fetch_guild, 43123123)
 
-        assert mock_command_interaction.get_guild() is None
+        else:
+            assert result is None
+            mock_app.rest.fetch_guild.assert_not_called()
 
-        mock_app.cache.get_guild.assert_not_called()
+    @pytest.mark.parametrize(
+        ("guild_id", "cacheless", "expect_hit"),
+        [(874356, False, True), (None, False, False), (321123, True, False)],
+    )
+    def test_get_guild(self, mock_command_interaction, mock_app, guild_id, cacheless, expect_hit):
+        mock_command_interaction.guild_id = guild_id
+        if cacheless:
+            mock_command_interaction.app = object()
 
-    def test_get_guild_when_cacheless(self, mock_command_interaction, mock_app):
-        mock_command_interaction.guild_id = 321123
-        mock_command_interaction.app = mock.Mock(traits.RESTAware)
+        result = mock_command_interaction.get_guild()
 
-        assert mock_command_interaction.get_guild() is None
+        if expect_hit:
+            assert result is mock_app.cache.get_guild.return_value
+            mock_app.cache.get_guild.assert_called_once_with(874356)
 
-        mock_app.cache.get_guild.assert_not_called()
+        else:
+            assert result is None
+            mock_app.cache.get_guild.assert_not_called()
@@ -30,11 +30,6 @@ from hikari.interactions import component_interactions
 from tests.hikari import hikari_test_helpers
 
 
-@pytest.fixture()
-def mock_app():
-    return mock.Mock(rest=mock.AsyncMock())
-
-
 class TestComponentInteraction:
     @pytest.fixture()
     def mock_component_interaction(self, mock_app):
@@ -80,7 +75,7 @@ class TestComponentInteraction:
 
     @pytest.mark.asyncio()
     async def test_fetch_channel(self, mock_component_interaction, mock_app):
-        mock_app.rest.fetch_channel.return_value = mock.Mock(channels.TextChannel)
+        mock_app.rest.fetch_channel.return_value = mock.Mock(channels.TextableChannel)
 
         assert await mock_component_interaction.fetch_channel() is mock_app.rest.fetch_channel.return_value
 
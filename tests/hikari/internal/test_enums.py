@@ -216,6 +216,43 @@ class TestEnum:
         assert returned == 69
         assert type(returned) != Enum
 
+    def test_call_when_in_range_gap_value(self):
+        class Enum(int, enums.Enum):
+            foo = 9
+            bar = 18
+            baz = 27
+
+        assert Enum._value_to_member_list_ is not None
+
+        returned = Enum(5)
+        assert returned == 5
+        assert type(returned) != Enum
+
+    def test_call_when_values_not_dense_ints(self):
+        class Enum(int, enums.Enum):
+            foo = 9
+            bar = 18
+            baz = 9000
+
+        assert Enum._value_to_member_list_ is None
+
+        returned = Enum(18)
+        assert returned is Enum.bar
+
+        returned = Enum(69)
+        assert returned == 69
+        assert type(returned) != Enum
+
+    def test_call_when_non_int_value_on_dense_int_enum(self):
+        class Enum(int, enums.Enum):
+            foo = 9
+            bar = 18
+            baz = 27
+
+        returned = Enum("okokok")
+        assert returned == "okokok"
+        assert type(returned) != Enum
+
     def test_getitem(self):
         class Enum(int, enums.Enum):
             foo = 9